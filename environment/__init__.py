@@ -0,0 +1,9 @@
+from gymnasium.envs.registration import register, registry
+
+# Registered once, on first import of the package; the env module itself is only
+# imported when gym.make() is called
+if "LanguageLearningEnv-v0" not in registry:
+    register(
+        id="LanguageLearningEnv-v0",
+        entry_point="environment.custom_env:LanguageLearningEnv",
+    )
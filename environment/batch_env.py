@@ -0,0 +1,123 @@
+import numpy as np
+from environment.custom_env import (
+    ACTION_TARGETS, STATE_RECORD, STATE_SIZE, pack_rng_state, unpack_rng_state)
+
+# Per-action dynamics, indexed by action (mirrors LanguageLearningEnv.step):
+# [reward on success, reward on failure, performance +/-, engagement +/-]
+_REWARD = np.array([[8, -7], [12, -7], [10, -7], [9, -3]], dtype=np.float64)
+_PERFORMANCE = np.array([[5, -5], [8, -3], [7, -4], [4, -2]], dtype=np.float64)
+_ENGAGEMENT = np.array([[3, -5], [5, -2], [2, -4], [8, -1]], dtype=np.float64)
+_SUCCESS_CAP = np.array([0.9, 0.85, 0.8, 0.9])
+_TARGETS = np.array([ACTION_TARGETS[a] for a in range(4)], dtype=np.float32)
+
+
+class BatchLanguageLearningEnv:
+    """N copies of LanguageLearningEnv stepped together as NumPy arrays.
+
+    Used for lookahead search: branch() copies one get_state() record into
+    every slot, then step() advances all branches with a single vectorized
+    update. All branches draw from one shared generator. branch() loads the
+    record's RNG into it, so a single branch replays the original env
+    exactly; search callers should reseed np_random after branching so
+    rollouts do not see the env's future draws.
+    """
+
+    def __init__(self, n_envs):
+        self.n_envs = n_envs
+        self.current_state = np.zeros(n_envs, dtype=np.int64)
+        self.position = np.zeros((n_envs, 3), dtype=np.float32)
+        self.performance = np.zeros(n_envs)
+        self.engagement = np.zeros(n_envs)
+        self.time_spent = np.zeros(n_envs)
+        self.error_count = np.zeros(n_envs, dtype=np.int64)
+        self.total_steps = np.zeros(n_envs, dtype=np.int64)
+        self.last_action = np.full(n_envs, -1, dtype=np.int64)
+        self.cumulative_reward = np.zeros(n_envs)
+        self.np_random = np.random.default_rng()
+
+    def branch(self, state):
+        """Load one STATE_SIZE record into all n_envs slots."""
+        if len(state) != STATE_SIZE:
+            raise ValueError(
+                f"Expected a {STATE_SIZE}-byte state record, got {len(state)} bytes")
+        fields = STATE_RECORD.unpack(state)
+        self.current_state[:] = fields[0]
+        self.position[:] = fields[1:4]
+        self.performance[:], self.engagement[:], self.time_spent[:] = fields[4:7]
+        self.error_count[:], self.total_steps[:], self.last_action[:] = fields[7:10]
+        self.cumulative_reward[:] = fields[10]
+        self.np_random.bit_generator.state = unpack_rng_state(fields[11:])
+
+    def get_state(self, index):
+        """Serialize branch `index` back into a record accepted by LanguageLearningEnv.set_state()."""
+        return STATE_RECORD.pack(
+            int(self.current_state[index]), *(float(p) for p in self.position[index]),
+            float(self.performance[index]), float(self.engagement[index]),
+            float(self.time_spent[index]), int(self.error_count[index]),
+            int(self.total_steps[index]), int(self.last_action[index]),
+            float(self.cumulative_reward[index]),
+            *pack_rng_state(self.np_random.bit_generator.state)
+        )
+
+    def observations(self):
+        return np.column_stack([
+            self.current_state, self.position,
+            self.performance, self.engagement, self.time_spent / 90.0
+        ]).astype(np.float32)
+
+    def step(self, actions):
+        actions = np.asarray(actions, dtype=np.int64)
+        self.total_steps += 1
+        self.time_spent += 1.0
+
+        # Move towards the target based on action (0.1 units max)
+        direction = _TARGETS[actions] - self.position
+        # Batched matmul takes the same dot-product path as np.linalg.norm on a
+        # single vector, so branches stay bit-identical to LanguageLearningEnv
+        distance = np.sqrt(np.matmul(
+            direction[:, None, :], direction[:, :, None])[:, 0, 0])
+        moving = distance > 0.1
+        self.position[moving] += (direction[moving] * np.minimum(
+            np.float32(0.1), distance[moving])[:, None]) / distance[moving][:, None]
+
+        # Action effects
+        level = self.current_state
+        success_rate = np.select(
+            [actions == 0, actions == 1, actions == 2],
+            [0.5 + (self.engagement / 200) - (level * 0.1),
+             0.4 + (self.performance / 200) + (level * 0.05),
+             0.3 + (self.performance / 150)],
+            0.6 + (self.engagement / 250))
+        success_rate = np.minimum(_SUCCESS_CAP[actions], success_rate)
+        success = self.np_random.random(self.n_envs) < success_rate
+        outcome = np.where(success, 0, 1)
+        rewards = _REWARD[actions, outcome].copy()
+        self.performance = np.minimum(
+            100, self.performance + _PERFORMANCE[actions, outcome])
+        self.engagement = np.minimum(
+            100, self.engagement + _ENGAGEMENT[actions, outcome])
+        self.error_count = np.where(success, 0, self.error_count + 1)
+
+        # Level progression
+        level_up = (self.performance >= 80) & (
+            self.total_steps % 10 == 0) & (self.current_state < 4)
+        self.current_state = self.current_state + level_up
+        rewards += 20 * level_up
+        self.performance = np.where(
+            level_up, np.maximum(60, self.performance - 15), self.performance)
+        self.position[level_up, 0] = -4 + self.current_state[level_up] * 2
+
+        bonus = self.total_steps % 5 == 0
+        rewards += 15 * bonus
+        self.engagement = np.where(
+            bonus, np.minimum(100, self.engagement + 10), self.engagement)
+
+        self.cumulative_reward += rewards
+
+        # Termination conditions
+        terminated = (self.current_state == 4) & (self.performance >= 90)
+        rewards += 50 * terminated
+        truncated = (self.error_count >= 4) | (self.time_spent >= 90)
+        self.last_action = actions.copy()
+
+        return self.observations(), rewards, terminated, truncated
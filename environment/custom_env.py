@@ -1,14 +1,46 @@
 import gymnasium as gym
 from gymnasium import spaces
 import numpy as np
-import random
-from environment.rendering import LanguageLearningRenderer
+import struct
+from environment.render_backends import load_renderer
+
+# Fixed-size snapshot of the env's internal state:
+# [state, x, y, z, performance, engagement, time, errors, steps, last_action,
+#  cumulative_reward, rng state (hi, lo), rng inc (hi, lo), has_uint32, uinteger]
+STATE_RECORD = struct.Struct("<i3f3d3id4QBI")
+STATE_SIZE = STATE_RECORD.size
+_U64 = (1 << 64) - 1
+
+# Target positions for actions
+ACTION_TARGETS = {
+    0: (-2, 2, 0),  # Vocabulary
+    1: (2, 2, 0),   # Conversation
+    2: (-2, -2, 0),  # Grammar
+    3: (2, -2, 0)   # Culture
+}
+
+
+def pack_rng_state(bit_generator_state):
+    state = bit_generator_state["state"]
+    return (state["state"] >> 64, state["state"] & _U64,
+            state["inc"] >> 64, state["inc"] & _U64,
+            bit_generator_state["has_uint32"], bit_generator_state["uinteger"])
+
+
+def unpack_rng_state(fields):
+    state_hi, state_lo, inc_hi, inc_lo, has_uint32, uinteger = fields
+    return {
+        "bit_generator": "PCG64",
+        "state": {"state": (state_hi << 64) | state_lo,
+                  "inc": (inc_hi << 64) | inc_lo},
+        "has_uint32": has_uint32, "uinteger": uinteger
+    }
 
 
 class LanguageLearningEnv(gym.Env):
     metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 30}
 
-    def __init__(self, render_mode=None):
+    def __init__(self, render_mode=None, render_backend="opengl"):
         # 0: Vocabulary, 1: Conversation, 2: Grammar, 3: Culture
         self.action_space = spaces.Discrete(4)
         self.observation_space = spaces.Box(
@@ -38,6 +70,8 @@ class LanguageLearningEnv(gym.Env):
         ]
 
         self.render_mode = render_mode
+        # The render stack (pygame, PyOpenGL) is only imported once a frame is rendered
+        self.render_backend = render_backend
         self.renderer = None
         self.reset()
 
@@ -55,7 +89,7 @@ class LanguageLearningEnv(gym.Env):
         self.last_action = -1
 
         if self.render_mode == "human" and self.renderer is None:
-            self.renderer = LanguageLearningRenderer(800, 600)
+            self.renderer = load_renderer(self.render_backend)(800, 600)
 
         return self._get_observation(), {}
 
@@ -78,16 +112,8 @@ class LanguageLearningEnv(gym.Env):
         truncated = False
         success = False
 
-        # Define target positions for actions
-        action_targets = {
-            0: (-2, 2, 0),  # Vocabulary
-            1: (2, 2, 0),   # Conversation
-            2: (-2, -2, 0),  # Grammar
-            3: (2, -2, 0)   # Culture
-        }
-
         # Move towards the target based on action
-        target = np.array(action_targets[action], dtype=np.float32)
+        target = np.array(ACTION_TARGETS[action], dtype=np.float32)
         direction = target - self.position[:3]
         distance = np.linalg.norm(direction)
         if distance > 0.1:
@@ -99,7 +125,7 @@ class LanguageLearningEnv(gym.Env):
         if action == 0:  # Vocabulary
             success_rate = min(
                 0.9, 0.5 + (self.engagement / 200) - (level * 0.1))
-            success = random.random() < success_rate
+            success = self.np_random.random() < success_rate
             reward += 8 if success else -7
             self.performance = min(
                 100, self.performance + (5 if success else -5))
@@ -110,7 +136,7 @@ class LanguageLearningEnv(gym.Env):
         elif action == 1:  # Conversation
             success_rate = min(
                 0.85, 0.4 + (self.performance / 200) + (level * 0.05))
-            success = random.random() < success_rate
+            success = self.np_random.random() < success_rate
             reward += 12 if success else -7
             self.performance = min(
                 100, self.performance + (8 if success else -3))
@@ -120,7 +146,7 @@ class LanguageLearningEnv(gym.Env):
 
         elif action == 2:  # Grammar
             success_rate = min(0.8, 0.3 + (self.performance / 150))
-            success = random.random() < success_rate
+            success = self.np_random.random() < success_rate
             reward += 10 if success else -7
             self.performance = min(
                 100, self.performance + (7 if success else -4))
@@ -130,7 +156,7 @@ class LanguageLearningEnv(gym.Env):
 
         elif action == 3:  # Culture
             success_rate = min(0.9, 0.6 + (self.engagement / 250))
-            success = random.random() < success_rate
+            success = self.np_random.random() < success_rate
             reward += 9 if success else -3
             self.performance = min(
                 100, self.performance + (4 if success else -2))
@@ -171,6 +197,29 @@ class LanguageLearningEnv(gym.Env):
 
         return self._get_observation(), reward, terminated, truncated, info
 
+    def get_state(self):
+        """Serialize the full internal state (including the RNG) to a STATE_SIZE byte record."""
+        return STATE_RECORD.pack(
+            int(self.current_state), *(float(p) for p in self.position),
+            float(self.performance), float(self.engagement), float(self.time_spent),
+            int(self.error_count), int(self.total_steps), int(self.last_action),
+            float(self.cumulative_reward),
+            *pack_rng_state(self.np_random.bit_generator.state)
+        )
+
+    def set_state(self, state):
+        """Restore a record produced by get_state(); the env continues exactly as the original would."""
+        if len(state) != STATE_SIZE:
+            raise ValueError(
+                f"Expected a {STATE_SIZE}-byte state record, got {len(state)} bytes")
+        fields = STATE_RECORD.unpack(state)
+        self.current_state = fields[0]
+        self.position = np.array(fields[1:4], dtype=np.float32)
+        self.performance, self.engagement, self.time_spent = fields[4:7]
+        self.error_count, self.total_steps, self.last_action = fields[7:10]
+        self.cumulative_reward = fields[10]
+        self.np_random.bit_generator.state = unpack_rng_state(fields[11:])
+
     def render(self):
         if self.render_mode == "human":
             if self.renderer:
@@ -184,7 +233,7 @@ class LanguageLearningEnv(gym.Env):
                 )
         elif self.render_mode == "rgb_array":
             if self.renderer is None:
-                self.renderer = LanguageLearningRenderer(800, 600)
+                self.renderer = load_renderer(self.render_backend)(800, 600)
             self.renderer.render_dynamic_scene(
                 current_level=self.current_state,
                 position=self.position,
@@ -0,0 +1,35 @@
+import importlib
+from importlib.metadata import entry_points
+
+# Built-in render backends as "module:attribute" so nothing is imported until a backend is used
+RENDER_BACKENDS = {
+    "opengl": "environment.rendering:LanguageLearningRenderer",
+}
+# Third-party backends can register themselves under this entry point group
+ENTRY_POINT_GROUP = "language_learning_env.renderers"
+
+_loaded = {}
+
+
+def available_backends():
+    """Names of the built-in and installed render backends."""
+    return sorted(set(RENDER_BACKENDS) | {ep.name for ep in entry_points(group=ENTRY_POINT_GROUP)})
+
+
+def load_renderer(name="opengl"):
+    """Import and return the renderer class of a backend; only called once rendering is requested.
+
+    A renderer class takes (window_width, window_height) and provides
+    render_dynamic_scene(), save_screenshot() and close().
+    """
+    if name not in _loaded:
+        if name in RENDER_BACKENDS:
+            module_name, attribute = RENDER_BACKENDS[name].split(":")
+            _loaded[name] = getattr(importlib.import_module(module_name), attribute)
+        else:
+            matches = [ep for ep in entry_points(group=ENTRY_POINT_GROUP) if ep.name == name]
+            if not matches:
+                raise ValueError(
+                    f"Unknown render backend {name!r}; available: {available_backends()}")
+            _loaded[name] = matches[0].load()
+    return _loaded[name]
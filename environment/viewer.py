@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import namedtuple
+import numpy as np
+from environment.render_backends import load_renderer
+
+# Render state of the env after a step, stamped with when it was published
+Snapshot = namedtuple("Snapshot", [
+    "time", "episode", "current_level", "position", "performance",
+    "engagement", "reward", "last_action"])
+
+
+class LiveViewer:
+    """Human-mode window that runs the simulation in its own thread.
+
+    The simulation thread steps the env at `speed` times real time
+    (`steps_per_second` env steps per second; speed=None runs unthrottled)
+    and publishes a Snapshot after every step. The main thread, which owns
+    the OpenGL context, draws the latest snapshot at a fixed `fps`,
+    interpolating the agent position between the last two snapshots of the
+    same episode. Frames are only drawn when something changed, so a slow
+    simulation does not spend CPU on identical frames and a fast one is never
+    held back by the renderer.
+    """
+
+    def __init__(self, fps=30, speed=1.0, steps_per_second=30, render_backend="opengl"):
+        self.fps = fps
+        self.render_backend = render_backend
+        self.speed = speed
+        self.steps_per_second = steps_per_second
+        self._lock = threading.Lock()
+        self._latest = (None, None)
+        self._stop = threading.Event()
+        self._error = None
+
+    def _publish(self, env, episode):
+        env = env.unwrapped
+        snapshot = Snapshot(
+            time.perf_counter(), episode, int(env.current_state),
+            np.array(env.position, dtype=np.float32), env.performance,
+            env.engagement, env.cumulative_reward, env.last_action)
+        with self._lock:
+            self._latest = (self._latest[1], snapshot)
+
+    def _simulate(self, env, policy, n_steps):
+        try:
+            obs, _ = env.reset()
+            episode = 0
+            self._publish(env, episode)
+            next_time = time.perf_counter()
+            for _ in range(n_steps):
+                if self._stop.is_set():
+                    break
+                obs, reward, terminated, truncated, info = env.step(policy(obs))
+                if self.speed:
+                    next_time += 1.0 / (self.steps_per_second * self.speed)
+                    delay = next_time - time.perf_counter()
+                    if delay > 0:
+                        self._stop.wait(delay)
+                    else:
+                        # Fell behind (slow policy): resume the schedule from now instead of bursting
+                        next_time = time.perf_counter()
+                self._publish(env, episode)
+                if terminated or truncated:
+                    obs, _ = env.reset()
+                    episode += 1
+        except Exception as error:
+            self._error = error
+
+    def _interpolated(self, now):
+        """Latest snapshot with the agent position blended from the previous one, and whether the agent has settled."""
+        with self._lock:
+            previous, current = self._latest
+        if current is None:
+            return None, False
+        if previous is None or previous.episode != current.episode:
+            return current, True
+        interval = current.time - previous.time
+        # Show the move from previous to current over one step interval after it was published
+        alpha = 1.0 if interval <= 0 else min(1.0, (now - current.time) / interval)
+        position = previous.position + alpha * (current.position - previous.position)
+        return current._replace(position=position), alpha >= 1.0
+
+    def run(self, env, policy, n_steps):
+        """Simulate `n_steps` steps of policy(obs) -> action in env and show them live.
+
+        Returns False if the window was closed before the simulation finished.
+        """
+        # Imported here so that importing this module (e.g. from main.py in spawned workers) never loads pygame
+        import pygame
+
+        renderer = load_renderer(self.render_backend)(800, 600)
+        simulation = threading.Thread(
+            target=self._simulate, args=(env, policy, n_steps), daemon=True)
+        simulation.start()
+        clock = pygame.time.Clock()
+        drawn = None
+        closed = False
+        while simulation.is_alive():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    closed = True
+                    self._stop.set()
+            snapshot, settled = self._interpolated(time.perf_counter())
+            if snapshot is not None and snapshot.time != drawn:
+                renderer.render_dynamic_scene(
+                    current_level=snapshot.current_level,
+                    position=snapshot.position,
+                    performance=snapshot.performance,
+                    engagement=snapshot.engagement,
+                    reward=snapshot.reward,
+                    last_action=snapshot.last_action
+                )
+                # Once the agent has settled, redraw only when a new snapshot arrives
+                drawn = snapshot.time if settled else None
+            clock.tick(self.fps)
+        simulation.join()
+        renderer.close()
+        if self._error:
+            raise self._error
+        return not closed
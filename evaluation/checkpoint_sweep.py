@@ -0,0 +1,102 @@
+import csv
+import glob
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from evaluation.eval_cache import EvaluationCache, init_single_thread_worker  # noqa: E402
+
+# CheckpointCallback output: <save_path>/<name_prefix>_<steps>_steps.zip
+CHECKPOINT_PATTERNS = {
+    "DQN": "./models/dqn/dqn_language_model_*_steps.zip",
+    "PPO": "./models/pg/ppo_language_model_*_steps.zip",
+}
+Z_95 = 1.96
+
+
+def discover_checkpoints(patterns=CHECKPOINT_PATTERNS):
+    """Return (algo, steps, path) for every checkpoint, sorted by algorithm and training steps."""
+    checkpoints = []
+    for algo, pattern in patterns.items():
+        for path in glob.glob(pattern):
+            match = re.search(r"_(\d+)_steps\.zip$", path)
+            if match:
+                checkpoints.append((algo, int(match.group(1)), path))
+    return sorted(checkpoints)
+
+
+def _evaluate_checkpoint(algo, steps, path, n_episodes, seed, cache_dir):
+    rewards, _ = EvaluationCache(cache_dir).evaluate(
+        path, algo, n_episodes, seed=seed)
+    return algo, steps, rewards
+
+
+def sweep_checkpoints(n_episodes=20, seed=0, n_workers=None, cache_dir="./.eval_cache"):
+    """Evaluate all checkpoints in parallel on the common seed set seed .. seed + n_episodes - 1.
+
+    Returns learning-curve rows (algo, steps, n_episodes, mean, std, ci_low,
+    ci_high), where the band is a 95% normal-approximation confidence
+    interval of the mean reward. Results go through the evaluation cache, so
+    re-running a sweep only evaluates new or changed checkpoints.
+    """
+    checkpoints = discover_checkpoints()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context,
+                             initializer=init_single_thread_worker) as pool:
+        futures = [pool.submit(_evaluate_checkpoint, algo, steps, path, n_episodes, seed, cache_dir)
+                   for algo, steps, path in checkpoints]
+        results = [future.result() for future in futures]
+
+    rows = []
+    for algo, steps, rewards in results:
+        mean = np.mean(rewards)
+        std = np.std(rewards, ddof=1) if len(rewards) > 1 else 0.0
+        half_width = Z_95 * std / np.sqrt(len(rewards))
+        rows.append((algo, steps, len(rewards), mean, std,
+                     mean - half_width, mean + half_width))
+    return rows
+
+
+def save_learning_curves(rows, csv_path="plots/learning_curves.csv", plot_path="plots/learning_curves.png"):
+    import matplotlib.pyplot as plt
+
+    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["algo", "steps", "n_episodes", "mean_reward",
+                         "std_reward", "ci95_low", "ci95_high"])
+        for row in rows:
+            writer.writerow([f"{value:.2f}" if isinstance(value, float) else value
+                             for value in row])
+
+    colors = {"DQN": "blue", "PPO": "green"}
+    plt.figure(figsize=(8, 5))
+    for algo in sorted({row[0] for row in rows}):
+        curve = [row for row in rows if row[0] == algo]
+        steps = [row[1] for row in curve]
+        plt.plot(steps, [row[3] for row in curve], label=algo,
+                 color=colors.get(algo), marker='o', markersize=5)
+        plt.fill_between(steps, [row[5] for row in curve], [row[6] for row in curve],
+                         color=colors.get(algo), alpha=0.2)
+    plt.xlabel('Training Steps')
+    plt.ylabel('Mean Reward')
+    plt.title('Learning Curves (mean reward, 95% CI)')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig(plot_path)
+    plt.close()
+    print(f"Saved learning curves to {csv_path} and {plot_path}")
+
+
+if __name__ == "__main__":
+    rows = sweep_checkpoints()
+    print(f"{'Algo':<5} {'Steps':>7} {'Mean':>8} {'95% CI':>20}")
+    for algo, steps, n, mean, std, low, high in rows:
+        print(f"{algo:<5} {steps:>7} {mean:>8.2f} [{low:>8.2f}, {high:>8.2f}]")
+    save_learning_curves(rows)
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import sys
+import numpy as np
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from environment import custom_env  # noqa: E402
+from environment.custom_env import LanguageLearningEnv  # noqa: E402
+
+DEFAULT_CACHE_DIR = "./.eval_cache"
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def env_fingerprint(env_kwargs=None):
+    """Identify the env dynamics and config; any edit to custom_env.py invalidates cached results."""
+    return {
+        "env": "LanguageLearningEnv-v0",
+        "source": file_hash(custom_env.__file__),
+        "kwargs": env_kwargs or {}
+    }
+
+
+_single_torch_thread = False
+
+
+def init_single_thread_worker():
+    """Process-pool initializer: models loaded in this worker run torch on one thread.
+
+    The pool provides the parallelism; the limit is applied in load_model()
+    so workers that only hit the cache never import torch.
+    """
+    global _single_torch_thread
+    _single_torch_thread = True
+
+
+def load_model(model_path, algo):
+    # Imported here so that cache hits never pay for importing torch
+    import torch
+    from stable_baselines3 import DQN, PPO
+    if _single_torch_thread:
+        torch.set_num_threads(1)
+    algorithms = {"DQN": DQN, "PPO": PPO}
+    return algorithms[algo].load(model_path)
+
+
+def run_episodes(model, env, seeds, deterministic=True):
+    """Run one episode per seed and return per-episode rewards and lengths."""
+    rewards, lengths = [], []
+    for seed in seeds:
+        obs, _ = env.reset(seed=int(seed))
+        done = False
+        total_reward = 0
+        length = 0
+        while not done:
+            action, _ = model.predict(obs, deterministic=deterministic)
+            obs, reward, terminated, truncated, _ = env.step(action)
+            total_reward += reward
+            length += 1
+            done = terminated or truncated
+        rewards.append(total_reward)
+        lengths.append(length)
+    return np.array(rewards, dtype=np.float64), np.array(lengths, dtype=np.int64)
+
+
+class EvaluationCache:
+    """On-disk cache of per-episode evaluation results.
+
+    Results are keyed by the checkpoint's content hash, the env fingerprint,
+    the deterministic flag and the base seed; episode i always uses seed
+    `seed + i`. A request for more episodes than are cached only runs the
+    missing ones and extends the entry, so unchanged checkpoints are never
+    evaluated twice.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, model_path, deterministic, seed, env_kwargs):
+        key = json.dumps({
+            "checkpoint": file_hash(model_path),
+            "env": env_fingerprint(env_kwargs),
+            "deterministic": deterministic,
+            "seed": seed
+        }, sort_keys=True)
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".npz")
+
+    def evaluate(self, model_path, algo, n_episodes, deterministic=True, seed=0, env_kwargs=None, model=None):
+        """Return (rewards, lengths) arrays for episodes with seeds seed .. seed + n_episodes - 1."""
+        path = self._entry_path(model_path, deterministic, seed, env_kwargs)
+        rewards = np.empty(0, dtype=np.float64)
+        lengths = np.empty(0, dtype=np.int64)
+        if os.path.exists(path):
+            with np.load(path) as cached:
+                rewards, lengths = cached["rewards"], cached["lengths"]
+
+        missing = n_episodes - len(rewards)
+        if missing > 0:
+            if model is None:
+                print(f"Loading {algo} model from {model_path}...")
+                model = load_model(model_path, algo)
+            print(
+                f"Evaluating {algo}: {len(rewards)} episodes cached, running {missing} more...")
+            env = LanguageLearningEnv(**(env_kwargs or {}))
+            seeds = np.arange(seed + len(rewards), seed + n_episodes)
+            new_rewards, new_lengths = run_episodes(
+                model, env, seeds, deterministic)
+            env.close()
+            rewards = np.concatenate([rewards, new_rewards])
+            lengths = np.concatenate([lengths, new_lengths])
+            # Write to a temporary file first so a crash never leaves a truncated entry
+            tmp_path = path + f".{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, rewards=rewards, lengths=lengths)
+            os.replace(tmp_path, path)
+
+        return rewards[:n_episodes], lengths[:n_episodes]
@@ -0,0 +1,100 @@
+import math
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+import numpy as np
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from environment.custom_env import LanguageLearningEnv  # noqa: E402
+from evaluation.eval_cache import init_single_thread_worker, load_model, run_episodes  # noqa: E402
+
+# Per-worker state, loaded once by the pool initializer
+_models = {}
+_env = None
+
+
+def _init_worker(model_paths):
+    global _env
+    init_single_thread_worker()
+    for algo, path in model_paths.items():
+        _models[algo] = load_model(path, algo)
+    _env = LanguageLearningEnv()
+
+
+def _run_chunk(algo, seeds, deterministic):
+    rewards, _ = run_episodes(_models[algo], _env, seeds, deterministic)
+    return rewards
+
+
+def sequential_compare(dqn_path, ppo_path, confidence=0.95, tolerance=10.0, batch_size=20,
+                       max_episodes=1000, seed=0, deterministic=True, n_workers=None):
+    """Compare PPO and DQN with as few episodes as the data allows.
+
+    Both models play the same seeds, so each seed gives a paired difference
+    (PPO - DQN). Batches of seeds are split across a process pool and, after
+    each batch, a confidence interval of the mean difference is checked:
+    the comparison stops when it excludes 0 (significant difference) or lies
+    within [-tolerance, tolerance] (equivalent). The interval uses a
+    Bonferroni correction over the maximum number of looks, so stopping
+    early keeps the overall error rate at 1 - confidence.
+    """
+    n_workers = n_workers or os.cpu_count()
+    max_looks = math.ceil(max_episodes / batch_size)
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * max_looks))
+    chunk_size = max(1, math.ceil(2 * batch_size / n_workers))
+
+    dqn_rewards = np.empty(0)
+    ppo_rewards = np.empty(0)
+    decision = "inconclusive"
+    low, high = -math.inf, math.inf
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context, initializer=_init_worker,
+                             initargs=({"DQN": dqn_path, "PPO": ppo_path},)) as pool:
+        while len(dqn_rewards) < max_episodes:
+            start = seed + len(dqn_rewards)
+            seeds = np.arange(start, start + min(batch_size, max_episodes - len(dqn_rewards)))
+            chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+            # Interleave both models' chunks so every worker stays busy
+            futures = {algo: [pool.submit(_run_chunk, algo, chunk, deterministic) for chunk in chunks]
+                       for algo in ("DQN", "PPO")}
+            dqn_rewards = np.concatenate(
+                [dqn_rewards] + [future.result() for future in futures["DQN"]])
+            ppo_rewards = np.concatenate(
+                [ppo_rewards] + [future.result() for future in futures["PPO"]])
+
+            differences = ppo_rewards - dqn_rewards
+            n = len(differences)
+            if n < 2:
+                continue
+            mean = differences.mean()
+            half_width = z * differences.std(ddof=1) / math.sqrt(n)
+            low, high = mean - half_width, mean + half_width
+            print(f"{n} episodes: PPO - DQN = {mean:.2f}, CI [{low:.2f}, {high:.2f}]")
+            if low > 0:
+                decision = "PPO better"
+                break
+            if high < 0:
+                decision = "DQN better"
+                break
+            if -tolerance <= low and high <= tolerance:
+                decision = f"equivalent within ±{tolerance}"
+                break
+
+    return {
+        "decision": decision, "episodes": len(dqn_rewards),
+        "mean_difference": float(np.mean(ppo_rewards - dqn_rewards)),
+        "confidence_interval": (float(low), float(high)),
+        "DQN": dqn_rewards, "PPO": ppo_rewards
+    }
+
+
+if __name__ == "__main__":
+    result = sequential_compare("./models/dqn/dqn_language_model.zip",
+                                "./models/pg/pg_language_model.zip")
+    low, high = result["confidence_interval"]
+    print(f"\nDecision: {result['decision']} after {result['episodes']} episodes per model")
+    print(f"Difference (PPO - DQN): {result['mean_difference']:.2f} (CI [{low:.2f}, {high:.2f}])")
@@ -1,46 +1,44 @@
-from environment.custom_env import LanguageLearningEnv
+import environment  # noqa: F401 (registers LanguageLearningEnv-v0)
+from environment.viewer import LiveViewer
+from evaluation.eval_cache import EvaluationCache
+from evaluation.sequential_compare import sequential_compare
+from recording.render_farm import render_videos
+from recording.trajectory import TrajectoryRecorder
 import os
 import numpy as np
 from stable_baselines3 import DQN, PPO
-from stable_baselines3.common.evaluation import evaluate_policy
 from stable_baselines3.common.monitor import Monitor
 import gymnasium as gym
-from gymnasium.envs.registration import register
-import pygame
 import imageio
 
-# Append the project root directory to sys.path
-import sys
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(
-    os.path.abspath(__file__)), "environment"))
-sys.path.append(os.path.join(os.path.dirname(
-    os.path.abspath(__file__)), "training"))
 
+def evaluate_and_compare_models(dqn_path, ppo_path, n_eval_episodes=10, cache=None, sequential=False, confidence=0.95, tolerance=10.0):
+    if sequential:
+        # n_eval_episodes becomes the budget; the test stops as soon as it can decide
+        result = sequential_compare(
+            dqn_path, ppo_path, confidence=confidence, tolerance=tolerance,
+            max_episodes=n_eval_episodes)
+        low, high = result["confidence_interval"]
+        print("\nPerformance Comparison (sequential):")
+        print(f"DQN: {np.mean(result['DQN']):.2f} ± {np.std(result['DQN']):.2f}")
+        print(f"PPO: {np.mean(result['PPO']):.2f} ± {np.std(result['PPO']):.2f}")
+        print(
+            f"Difference (PPO - DQN): {result['mean_difference']:.2f}, CI [{low:.2f}, {high:.2f}]")
+        print(
+            f"Decision: {result['decision']} after {result['episodes']} episodes per model")
+        return {"DQN": (np.mean(result["DQN"]), np.std(result["DQN"])),
+                "PPO": (np.mean(result["PPO"]), np.std(result["PPO"]))}
 
-register(
-    id="LanguageLearningEnv-v0",
-    entry_point="environment.custom_env:LanguageLearningEnv",
-)
-
-
-def evaluate_and_compare_models(dqn_path, ppo_path, n_eval_episodes=10):
-    env = gym.make("LanguageLearningEnv-v0")
-    env = Monitor(env)
-
-    print("Loading DQN model...")
-    dqn_model = DQN.load(dqn_path, env=env)
-    print("Loading PPO model...")
-    ppo_model = PPO.load(ppo_path, env=env)
+    cache = cache or EvaluationCache()
 
     print(f"Evaluating DQN over {n_eval_episodes} episodes...")
-    dqn_mean_reward, dqn_std_reward = evaluate_policy(
-        dqn_model, env, n_eval_episodes=n_eval_episodes, deterministic=True)
+    dqn_rewards, _ = cache.evaluate(dqn_path, "DQN", n_eval_episodes)
+    dqn_mean_reward, dqn_std_reward = np.mean(dqn_rewards), np.std(dqn_rewards)
     print(f"DQN - Mean Reward: {dqn_mean_reward:.2f} ± {dqn_std_reward:.2f}")
 
     print(f"Evaluating PPO over {n_eval_episodes} episodes...")
-    ppo_mean_reward, ppo_std_reward = evaluate_policy(
-        ppo_model, env, n_eval_episodes=n_eval_episodes, deterministic=True)
+    ppo_rewards, _ = cache.evaluate(ppo_path, "PPO", n_eval_episodes)
+    ppo_mean_reward, ppo_std_reward = np.mean(ppo_rewards), np.std(ppo_rewards)
     print(f"PPO - Mean Reward: {ppo_mean_reward:.2f} ± {ppo_std_reward:.2f}")
 
     print("\nPerformance Comparison:")
@@ -48,13 +46,24 @@ def evaluate_and_compare_models(dqn_path, ppo_path, n_eval_episodes=10):
     print(f"PPO: {ppo_mean_reward:.2f} ± {ppo_std_reward:.2f}")
     print(f"Difference (PPO - DQN): {(ppo_mean_reward - dqn_mean_reward):.2f}")
 
-    env.close()
     return {"DQN": (dqn_mean_reward, dqn_std_reward), "PPO": (ppo_mean_reward, ppo_std_reward)}
 
 
-def simulate_agent(model, render_mode="human", output_video=None, target_frames=900):
-    env = gym.make("LanguageLearningEnv-v0", render_mode=render_mode)
+def simulate_agent(model, render_mode="human", output_video=None, target_frames=900, record_path=None, seed=None, speed=1.0):
+    # Human mode is drawn by LiveViewer, so the env itself never renders inside step()
+    env = gym.make("LanguageLearningEnv-v0",
+                   render_mode=None if render_mode == "human" else render_mode)
     env = Monitor(env)
+    if record_path:
+        env = TrajectoryRecorder(env, record_path, seed=seed)
+
+    if render_mode == "human":
+        # speed: 1.0 = real time (30 steps/s), N = N times faster, None = unthrottled
+        LiveViewer(fps=30, speed=speed).run(
+            env, lambda obs: model.predict(obs, deterministic=True)[0], target_frames)
+        env.close()
+        return
+
     frames = []
     total_steps = 0
 
@@ -72,12 +81,6 @@ def simulate_agent(model, render_mode="human", output_video=None, target_frames=
         if terminated or truncated:
             obs, _ = env.reset()
 
-        if render_mode == "human":
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    env.close()
-                    return
-
     if output_video and frames:
         os.makedirs(os.path.dirname(output_video), exist_ok=True)
         writer = imageio.get_writer(output_video, fps=30)
@@ -108,15 +111,21 @@ def main():
 
     print("\nSimulating DQN agent interactively (close window to proceed)...")
     simulate_agent(dqn_model, render_mode="human")
-    print("Saving DQN simulation video...")
-    simulate_agent(dqn_model, render_mode="rgb_array",
-                   output_video="video/dqn_simulation.mp4")
+    print("Recording DQN simulation...")
+    simulate_agent(dqn_model, render_mode=None,
+                   record_path="recordings/dqn_simulation.traj")
 
     print("\nSimulating PPO agent interactively (close window to proceed)...")
     simulate_agent(ppo_model, render_mode="human")
-    print("Saving PPO simulation video...")
-    simulate_agent(ppo_model, render_mode="rgb_array",
-                   output_video="video/ppo_simulation.mp4")
+    print("Recording PPO simulation...")
+    simulate_agent(ppo_model, render_mode=None,
+                   record_path="recordings/ppo_simulation.traj")
+
+    print("\nRendering simulation videos in parallel segments...")
+    render_videos([
+        ("recordings/dqn_simulation.traj", "video/dqn_simulation.mp4", 900),
+        ("recordings/ppo_simulation.traj", "video/ppo_simulation.mp4", 900),
+    ])
 
     print("\nExperiment Summary:")
     print(
@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import imageio
+import imageio_ffmpeg
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from environment.custom_env import LanguageLearningEnv  # noqa: E402
+from environment.render_backends import load_renderer  # noqa: E402
+from recording.trajectory import TrajectoryReader, replay_episode  # noqa: E402
+
+FPS = 30
+
+# One renderer (and GL context) per worker process, created on first use
+_renderer = None
+
+
+def _get_renderer():
+    global _renderer
+    if _renderer is None:
+        _renderer = load_renderer()(800, 600)
+    return _renderer
+
+
+def plan_segments(total_frames, segment_frames):
+    """Split frames [0, total_frames) into consecutive (start, end) step ranges."""
+    return [(start, min(start + segment_frames, total_frames))
+            for start in range(0, total_frames, segment_frames)]
+
+
+def render_segment(record_path, start, end, segment_path):
+    """Render recorded steps [start, end) of a trajectory file into its own video file.
+
+    Episodes entirely before `start` are skipped through the index; the
+    episode containing `start` is replayed without rendering up to it.
+    """
+    renderer = _get_renderer()
+    env = LanguageLearningEnv()
+    writer = imageio.get_writer(segment_path, fps=FPS)
+    step = 0
+    for episode in TrajectoryReader(record_path):
+        if step + len(episode.actions) <= start:
+            step += len(episode.actions)
+            continue
+        for _ in replay_episode(episode, env):
+            if step >= start:
+                renderer.render_dynamic_scene(
+                    current_level=env.current_state,
+                    position=env.position,
+                    performance=env.performance,
+                    engagement=env.engagement,
+                    reward=env.cumulative_reward,
+                    last_action=env.last_action
+                )
+                writer.append_data(renderer.save_screenshot(return_array=True))
+            step += 1
+            if step >= end:
+                break
+        if step >= end:
+            break
+    writer.close()
+    env.close()
+    return segment_path
+
+
+def concat_segments(segment_paths, output_video):
+    """Join segment videos in order with ffmpeg's concat demuxer, copying streams without re-encoding."""
+    list_path = output_video + ".segments.txt"
+    with open(list_path, "w") as f:
+        for path in segment_paths:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+    try:
+        subprocess.run(
+            [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-loglevel", "error",
+             "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", output_video],
+            check=True)
+    finally:
+        os.remove(list_path)
+
+
+def render_videos(jobs, n_workers=None, segment_frames=150):
+    """Render several recordings to video, segment by segment, across one process pool.
+
+    `jobs` is a list of (record_path, output_video, target_frames). Every
+    segment of every job is an independent task, so a batch of videos keeps
+    all workers busy; each finished video is concatenated in step order.
+    Recordings without any steps are skipped.
+
+    Workers are spawned, so each one re-imports the caller's __main__
+    module. Call this from a light entry point (e.g. `python
+    recording/render_farm.py`) rather than a script that imports
+    stable_baselines3/torch at module top, or every worker loads them too.
+    """
+    n_workers = n_workers or os.cpu_count()
+    # GL contexts do not survive fork, so workers are always spawned
+    context = multiprocessing.get_context("spawn")
+    work_dir = tempfile.mkdtemp(prefix="render_farm_")
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as pool:
+            pending = []
+            for job_id, (record_path, output_video, target_frames) in enumerate(jobs):
+                reader = TrajectoryReader(record_path)
+                total_frames = min(
+                    target_frames, sum(n_steps for _, _, n_steps in reader.index))
+                if total_frames == 0:
+                    print(f"Skipping {record_path}: the recording has no steps")
+                    continue
+                futures = [
+                    pool.submit(render_segment, record_path, start, end,
+                                os.path.join(work_dir, f"job{job_id}_{i:04d}.mp4"))
+                    for i, (start, end) in enumerate(plan_segments(total_frames, segment_frames))
+                ]
+                pending.append((output_video, total_frames, futures))
+
+            for output_video, total_frames, futures in pending:
+                segment_paths = [future.result() for future in futures]
+                os.makedirs(os.path.dirname(output_video) or ".", exist_ok=True)
+                concat_segments(segment_paths, output_video)
+                print(
+                    f"Video saved as {output_video} with {total_frames} frames (~{total_frames/FPS:.1f} seconds)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    # python recording/render_farm.py <recording.traj> <output.mp4> [target_frames]
+    record_path, output_video = sys.argv[1:3]
+    target_frames = int(sys.argv[3]) if len(sys.argv) > 3 else 900
+    render_videos([(record_path, output_video, target_frames)])
@@ -0,0 +1,157 @@
+import os
+import struct
+from collections import namedtuple
+import gymnasium as gym
+import numpy as np
+
+# Binary trajectory format (little-endian):
+#   MAGIC
+#   per episode: EPISODE_HEADER (seed, n_steps), then n_steps uint8 actions,
+#                n_steps float32 rewards, n_steps uint8 flags
+#   index: INDEX_ENTRY (offset, seed, n_steps) per episode
+#   FOOTER (index offset, episode count), MAGIC
+# Replaying an episode is env.reset(seed=seed) followed by its actions, which
+# reproduces every env state exactly because the env only draws from np_random.
+MAGIC = b"LLTRAJ01"
+EPISODE_HEADER = struct.Struct("<qI")
+INDEX_ENTRY = struct.Struct("<QqI")
+FOOTER = struct.Struct("<QI")
+TERMINATED = 1
+TRUNCATED = 2
+
+Episode = namedtuple(
+    "Episode", ["seed", "actions", "rewards", "terminated", "truncated"])
+
+
+class TrajectoryWriter:
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.index = []
+
+    def write_episode(self, seed, actions, rewards, terminated, truncated):
+        actions = np.asarray(actions, dtype=np.uint8)
+        flags = (np.asarray(terminated, dtype=np.uint8) * TERMINATED |
+                 np.asarray(truncated, dtype=np.uint8) * TRUNCATED)
+        self.index.append((self.file.tell(), seed, len(actions)))
+        self.file.write(EPISODE_HEADER.pack(seed, len(actions)))
+        self.file.write(actions.tobytes())
+        self.file.write(np.asarray(rewards, dtype="<f4").tobytes())
+        self.file.write(flags.astype(np.uint8).tobytes())
+
+    def close(self):
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        for entry in self.index:
+            self.file.write(INDEX_ENTRY.pack(*entry))
+        self.file.write(FOOTER.pack(index_offset, len(self.index)))
+        self.file.write(MAGIC)
+        self.file.close()
+
+
+class TrajectoryRecorder(gym.Wrapper):
+    """Records seed, actions, rewards and terminal flags of every episode to a trajectory file.
+
+    Resets without an explicit seed get one drawn from `seed`, so every
+    recorded episode can be replayed with replay_episode(). The file and its
+    episode index are finalized on close().
+    """
+
+    def __init__(self, env, path, seed=None):
+        super().__init__(env)
+        self.writer = TrajectoryWriter(path)
+        self.seed_rng = np.random.default_rng(seed)
+        self.episode_seed = None
+        self.actions, self.rewards = [], []
+        self.terminated, self.truncated = [], []
+
+    def reset(self, *, seed=None, options=None):
+        self._flush_episode()
+        if seed is None:
+            seed = int(self.seed_rng.integers(2**31))
+        self.episode_seed = seed
+        return self.env.reset(seed=seed, options=options)
+
+    def step(self, action):
+        if isinstance(action, np.ndarray):
+            action = action.item()
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        self.actions.append(action)
+        self.rewards.append(reward)
+        self.terminated.append(terminated)
+        self.truncated.append(truncated)
+        return obs, reward, terminated, truncated, info
+
+    def _flush_episode(self):
+        if self.episode_seed is not None and self.actions:
+            self.writer.write_episode(
+                self.episode_seed, self.actions, self.rewards,
+                self.terminated, self.truncated)
+        self.actions, self.rewards = [], []
+        self.terminated, self.truncated = [], []
+
+    def close(self):
+        self._flush_episode()
+        self.writer.close()
+        super().close()
+
+
+class TrajectoryReader:
+    """Random access to the episodes of a trajectory file through its index."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a trajectory file")
+            f.seek(-(FOOTER.size + len(MAGIC)), os.SEEK_END)
+            index_offset, count = FOOTER.unpack(f.read(FOOTER.size))
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} has no episode index (recorder not closed?)")
+            f.seek(index_offset)
+            self.index = [INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size))
+                          for _ in range(count)]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.episode(i)
+
+    def episode(self, i):
+        offset, seed, n_steps = self.index[i]
+        with open(self.path, "rb") as f:
+            f.seek(offset + EPISODE_HEADER.size)
+            data = f.read(n_steps * 6)
+        actions = np.frombuffer(data, dtype=np.uint8, count=n_steps)
+        rewards = np.frombuffer(
+            data, dtype="<f4", count=n_steps, offset=n_steps).astype(np.float64)
+        flags = np.frombuffer(
+            data, dtype=np.uint8, count=n_steps, offset=n_steps * 5)
+        return Episode(seed, actions, rewards,
+                       (flags & TERMINATED) != 0, (flags & TRUNCATED) != 0)
+
+    def episode_returns(self):
+        return np.array([episode.rewards.sum() for episode in self])
+
+
+def replay_episode(episode, env):
+    """Re-step `env` through a recorded episode, yielding (obs, reward, terminated, truncated, info).
+
+    No model is needed; callers can render or inspect `env` between steps.
+    Raises RuntimeError if the env does not reproduce the recorded rewards,
+    e.g. because the env dynamics changed since the recording.
+    """
+    obs, _ = env.reset(seed=episode.seed)
+    for step, action in enumerate(episode.actions):
+        obs, reward, terminated, truncated, info = env.step(int(action))
+        if (reward != episode.rewards[step] or terminated != episode.terminated[step]
+                or truncated != episode.truncated[step]):
+            raise RuntimeError(
+                f"Replay of episode with seed {episode.seed} diverged at step {step}")
+        yield obs, reward, terminated, truncated, info
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
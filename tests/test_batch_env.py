@@ -0,0 +1,44 @@
+import numpy as np
+from environment.batch_env import BatchLanguageLearningEnv
+from environment.custom_env import STATE_SIZE, LanguageLearningEnv
+
+
+def test_state_round_trip():
+    env = LanguageLearningEnv()
+    env.reset(seed=3)
+    for action in [0, 1, 2, 3, 1]:
+        env.step(action)
+    record = env.get_state()
+    assert len(record) == STATE_SIZE
+
+    restored = LanguageLearningEnv()
+    restored.reset(seed=99)
+    restored.set_state(record)
+    assert restored.get_state() == record
+
+    # Both continue identically, including the RNG draws
+    for action in [1, 0, 3, 2, 1, 1]:
+        expected = env.step(action)
+        actual = restored.step(action)
+        np.testing.assert_array_equal(expected[0], actual[0])
+        assert expected[1:4] == actual[1:4]
+    assert restored.get_state() == env.get_state()
+
+
+def test_single_branch_matches_env():
+    rng = np.random.default_rng(0)
+    for seed in range(5):
+        env = LanguageLearningEnv()
+        env.reset(seed=seed)
+        batch = BatchLanguageLearningEnv(1)
+        batch.branch(env.get_state())
+        done = False
+        while not done:
+            action = int(rng.integers(4))
+            obs, reward, terminated, truncated, _ = env.step(action)
+            batch_obs, batch_rewards, batch_terminated, batch_truncated = batch.step([action])
+            np.testing.assert_array_equal(batch_obs[0], obs)
+            assert batch_rewards[0] == reward
+            assert (batch_terminated[0], batch_truncated[0]) == (terminated, truncated)
+            assert batch.get_state(0) == env.get_state()
+            done = terminated or truncated
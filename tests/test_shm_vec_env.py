@@ -0,0 +1,63 @@
+import os
+import signal
+import numpy as np
+import pytest
+from stable_baselines3.common.vec_env import DummyVecEnv
+from environment.custom_env import LanguageLearningEnv
+from training.shm_vec_env import SharedMemoryVecEnv
+
+
+class FailingEnv(LanguageLearningEnv):
+    def step(self, action):
+        if self.total_steps == 2:
+            raise ValueError("boom")
+        return super().step(action)
+
+
+def test_matches_dummy_vec_env():
+    env_fns = [LanguageLearningEnv for _ in range(3)]
+    shm_env, dummy_env = SharedMemoryVecEnv(env_fns), DummyVecEnv(env_fns)
+    try:
+        shm_env.seed(7)
+        dummy_env.seed(7)
+        np.testing.assert_array_equal(shm_env.reset(), dummy_env.reset())
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            actions = rng.integers(4, size=3)
+            obs, rewards, dones, infos = shm_env.step(actions)
+            expected_obs, expected_rewards, expected_dones, expected_infos = dummy_env.step(actions)
+            np.testing.assert_array_equal(obs, expected_obs)
+            np.testing.assert_array_equal(rewards, expected_rewards)
+            np.testing.assert_array_equal(dones, expected_dones)
+            for info, expected in zip(infos, expected_infos):
+                assert info["TimeLimit.truncated"] == expected["TimeLimit.truncated"]
+                if "terminal_observation" in expected:
+                    np.testing.assert_array_equal(
+                        info["terminal_observation"], expected["terminal_observation"])
+    finally:
+        shm_env.close()
+        dummy_env.close()
+
+
+def test_worker_exception_is_raised():
+    vec_env = SharedMemoryVecEnv([LanguageLearningEnv, FailingEnv])
+    try:
+        vec_env.reset()
+        vec_env.step(np.zeros(2, dtype=np.int64))
+        vec_env.step(np.zeros(2, dtype=np.int64))
+        with pytest.raises(RuntimeError, match="boom"):
+            vec_env.step(np.zeros(2, dtype=np.int64))
+    finally:
+        vec_env.close()
+
+
+def test_dead_worker_raises_instead_of_hanging():
+    vec_env = SharedMemoryVecEnv([LanguageLearningEnv, LanguageLearningEnv])
+    try:
+        vec_env.reset()
+        os.kill(vec_env.processes[1].pid, signal.SIGKILL)
+        vec_env.processes[1].join()
+        with pytest.raises(EOFError):
+            vec_env.step(np.zeros(2, dtype=np.int64))
+    finally:
+        vec_env.close()
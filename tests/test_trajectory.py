@@ -0,0 +1,41 @@
+import numpy as np
+from environment.custom_env import LanguageLearningEnv
+from recording.trajectory import TrajectoryReader, TrajectoryRecorder, replay_episode
+
+
+def record_episodes(path, n_episodes, seed=0):
+    env = TrajectoryRecorder(LanguageLearningEnv(), path, seed=seed)
+    rng = np.random.default_rng(seed)
+    recorded = []
+    for _ in range(n_episodes):
+        env.reset()
+        done = False
+        rewards = []
+        while not done:
+            _, reward, terminated, truncated, _ = env.step(np.array(rng.integers(4)))
+            rewards.append(reward)
+            done = terminated or truncated
+        recorded.append((env.episode_seed, rewards))
+    env.close()
+    return recorded
+
+
+def test_round_trip_and_replay(tmp_path):
+    path = tmp_path / "episodes.traj"
+    recorded = record_episodes(str(path), n_episodes=4)
+
+    reader = TrajectoryReader(str(path))
+    assert len(reader) == 4
+    # Read back by index, in reverse order to exercise seeking
+    for i in reversed(range(4)):
+        episode = reader.episode(i)
+        seed, rewards = recorded[i]
+        assert episode.seed == seed
+        np.testing.assert_array_equal(episode.rewards, rewards)
+        assert episode.terminated[-1] or episode.truncated[-1]
+        assert not (episode.terminated[:-1] | episode.truncated[:-1]).any()
+
+        replayed = [step[1] for step in replay_episode(episode, LanguageLearningEnv())]
+        assert replayed == rewards
+    np.testing.assert_allclose(
+        reader.episode_returns(), [sum(rewards) for _, rewards in recorded])
@@ -0,0 +1,121 @@
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from stable_baselines3.common.callbacks import BaseCallback
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from training.tuned_settings import DEFAULT_SETTINGS, save_tuned_settings  # noqa: E402
+
+# Trial length and the warm-up excluded from timing (DQN's learning_starts, PPO's first rollout)
+TRIAL_STEPS = {"dqn": 6000, "ppo": 4 * 2048}
+WARMUP_STEPS = {"dqn": 1500, "ppo": 2048}
+BATCH_SIZES = (64, 128, 256)
+MAX_ENVS = 64
+
+
+class ThroughputCallback(BaseCallback):
+    """Measures env steps/sec and gradient updates/sec after a warm-up."""
+
+    def __init__(self, warmup_steps):
+        super().__init__()
+        self.warmup_steps = warmup_steps
+        self.start = None
+        self.metrics = None
+
+    def _gradient_steps(self):
+        if hasattr(self.model, "n_epochs"):
+            # PPO counts epochs; each epoch is one pass over the rollout in mini-batches
+            rollout_size = self.model.n_steps * self.model.n_envs
+            return self.model._n_updates * math.ceil(rollout_size / self.model.batch_size)
+        return self.model._n_updates
+
+    def _on_step(self):
+        if self.start is None and self.num_timesteps >= self.warmup_steps:
+            self.start = (time.perf_counter(), self.num_timesteps, self._gradient_steps())
+        return True
+
+    def _on_training_end(self):
+        start_time, start_steps, start_updates = self.start
+        elapsed = time.perf_counter() - start_time
+        updates_per_sec = (self._gradient_steps() - start_updates) / elapsed
+        self.metrics = {
+            "env_steps_per_sec": (self.num_timesteps - start_steps) / elapsed,
+            "updates_per_sec": updates_per_sec,
+            "samples_per_sec": updates_per_sec * self.model.batch_size,
+        }
+
+
+def _run_trial(algo, settings):
+    if algo == "dqn":
+        from training.dqn_training import train_dqn as train
+    else:
+        from training.pg_training import train_ppo as train
+    callback = ThroughputCallback(WARMUP_STEPS[algo])
+    train(settings, total_timesteps=TRIAL_STEPS[algo], trial_callback=callback)
+    return callback.metrics
+
+
+def run_trial(algo, settings):
+    """Time one short training run in a fresh process, so torch thread settings don't leak."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_run_trial, algo, settings).result()
+
+
+def _powers_of_two(limit):
+    return [2 ** i for i in range(int(math.log2(limit)) + 1)]
+
+
+def autotune(algo, max_envs=MAX_ENVS):
+    """Pick the highest-throughput settings for this host and save them for train_<algo>.
+
+    Searches one group of knobs at a time, keeping the best so far: env count
+    with vectorization backend, then torch intra-op threads, then batch size.
+    The first two stages are ranked by end-to-end env steps/sec, which
+    includes the time spent in gradient updates (DQN does one update per env
+    per train step, so the updates per sample do not depend on the env
+    count). A larger batch means fewer updates for the same data, so the
+    batch-size stage is ranked by samples processed per second in updates
+    (updates/sec * batch_size) instead.
+    """
+    cpus = os.cpu_count() or 1
+    env_counts = _powers_of_two(min(max_envs, cpus))
+    # (metric the stage is ranked by, candidate changes)
+    stages = [
+        ("env_steps_per_sec",
+         [{"n_envs": 1, "vec_env": "dummy"}] +
+         [{"n_envs": n, "vec_env": backend} for n in env_counts[1:]
+          for backend in ("dummy", "subproc", "shm")]),
+        ("env_steps_per_sec",
+         [{"torch_threads": None}] + [{"torch_threads": n} for n in _powers_of_two(cpus)]),
+        ("samples_per_sec", [{"batch_size": n} for n in BATCH_SIZES]),
+    ]
+
+    best, best_metrics = dict(DEFAULT_SETTINGS[algo]), None
+    for metric, stage in stages:
+        stage_best = None
+        for change in stage:
+            settings = {**best, **change}
+            metrics = run_trial(algo, settings)
+            print(f"{algo.upper()} {settings}: {metrics['env_steps_per_sec']:,.0f} steps/s, "
+                  f"{metrics['updates_per_sec']:,.1f} updates/s, "
+                  f"{metrics['samples_per_sec']:,.0f} samples/s")
+            if stage_best is None or metrics[metric] > stage_best[1][metric]:
+                stage_best = (settings, metrics)
+        best, best_metrics = stage_best
+
+    save_tuned_settings(algo, best, best_metrics)
+    print(f"Best {algo.upper()} settings for this host: {best} "
+          f"({best_metrics['env_steps_per_sec']:,.0f} steps/s)")
+    return best, best_metrics
+
+
+if __name__ == "__main__":
+    # python training/autotune.py [dqn] [ppo]
+    for algo in sys.argv[1:] or ["dqn", "ppo"]:
+        autotune(algo)
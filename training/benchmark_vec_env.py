@@ -0,0 +1,37 @@
+import os
+import sys
+import time
+import numpy as np
+from stable_baselines3.common.vec_env import SubprocVecEnv
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from environment.custom_env import LanguageLearningEnv  # noqa: E402
+from training.shm_vec_env import SharedMemoryVecEnv  # noqa: E402
+
+BACKENDS = {"subproc": SubprocVecEnv, "shm": SharedMemoryVecEnv}
+
+
+def measure_throughput(backend, n_envs, n_steps=2000):
+    """Env steps per second of random-action stepping through a VecEnv backend."""
+    vec_env = BACKENDS[backend]([LanguageLearningEnv for _ in range(n_envs)])
+    vec_env.reset()
+    rng = np.random.default_rng(0)
+    actions = rng.integers(4, size=(n_steps, n_envs))
+    start = time.perf_counter()
+    for step in range(n_steps):
+        vec_env.step(actions[step])
+    elapsed = time.perf_counter() - start
+    vec_env.close()
+    return n_steps * n_envs / elapsed
+
+
+if __name__ == "__main__":
+    print(f"{os.cpu_count()} CPUs")
+    print(f"{'Workers':>7} {'SubprocVecEnv':>14} {'SharedMemory':>14} {'Speedup':>8}")
+    for n_envs in (4, 8, 16, 32, 64):
+        n_steps = max(200, 8000 // n_envs)
+        subproc = measure_throughput("subproc", n_envs, n_steps)
+        shm = measure_throughput("shm", n_envs, n_steps)
+        print(f"{n_envs:>7} {subproc:>14,.0f} {shm:>14,.0f} {shm / subproc:>7.2f}x")
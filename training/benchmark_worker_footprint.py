@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Modules a worker imports before building its env: the bare env module, or the path a
+# make_training_env()/SharedMemoryVecEnv worker takes (stable_baselines3 and torch included)
+ENTRY_MODULES = {
+    "env only": "environment.custom_env",
+    "training worker": "training.tuned_settings",
+}
+
+# Run in a fresh interpreter, like a spawned VecEnv worker: import the env, build one, report cost
+_WORKER_SCRIPT = """
+import importlib, json, resource, sys, time
+start = time.perf_counter()
+if {with_render_stack}:
+    import environment.rendering  # what custom_env used to import at module top
+importlib.import_module("{entry_module}")
+from environment.custom_env import LanguageLearningEnv
+env = LanguageLearningEnv()
+elapsed = time.perf_counter() - start
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+print(json.dumps({{"import_s": elapsed, "rss_mb": max_rss / (1024 ** 2 if sys.platform == "darwin" else 1024),
+                   "modules": len(sys.modules)}}))
+"""
+
+
+def measure_worker(with_render_stack, entry_module="environment.custom_env", repeats=5):
+    """Median import+construction time, peak RSS and module count of a fresh env worker process."""
+    # pygame prints a banner on import; keep stdout for the JSON result
+    env = {**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+    results = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", _WORKER_SCRIPT.format(
+                with_render_stack=with_render_stack, entry_module=entry_module)],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: float(np.median([result[key] for result in results])) for key in results[0]}
+
+
+if __name__ == "__main__":
+    print(f"{'Worker':<34} {'Import (ms)':>12} {'Peak RSS (MB)':>14} {'Modules':>8}")
+    for name, entry_module in ENTRY_MODULES.items():
+        for label, with_render_stack in (("before", True), ("after", False)):
+            result = measure_worker(with_render_stack, entry_module)
+            print(f"{f'{name} ({label})':<34} {result['import_s'] * 1000:>12.1f} "
+                  f"{result['rss_mb']:>14.1f} {result['modules']:>8.0f}")
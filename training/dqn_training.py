@@ -1,26 +1,28 @@
 import os
 import gymnasium as gym
+import torch
 from stable_baselines3 import DQN
 from stable_baselines3.common.callbacks import CheckpointCallback, EvalCallback
 from stable_baselines3.common.monitor import Monitor
-from gymnasium.envs.registration import register
 import sys
 # Append the project root directory to sys.path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
+import environment  # noqa: E402,F401 (registers LanguageLearningEnv-v0)
+from training.tuned_settings import load_tuned_settings, make_training_env  # noqa: E402
 
-# Register the custom environment
-register(
-    id="LanguageLearningEnv-v0",
-    entry_point="environment.custom_env:LanguageLearningEnv",
-)
 
+def train_dqn(settings=None, total_timesteps=100000, trial_callback=None):
+    # Throughput settings: autotuned for this host if available, else the old defaults.
+    # A trial run (autotune passes trial_callback) skips logging, callbacks and saving.
+    trial = trial_callback is not None
+    settings = settings or load_tuned_settings("dqn")
+    if settings["torch_threads"]:
+        torch.set_num_threads(settings["torch_threads"])
 
-def train_dqn():
-    # Create the environment and wrap with Monitor for logging
-    env = gym.make("LanguageLearningEnv-v0")
-    env = Monitor(env, filename="./training/logs/dqn_monitor_logs")
+    # Create the (vectorized) environment, each copy wrapped with Monitor for logging
+    env = make_training_env(
+        settings, monitor_path=None if trial else "./training/logs/dqn_monitor_logs")
 
     # Define the DQN model with tuned hyperparameters
     model = DQN(
@@ -29,20 +31,28 @@ def train_dqn():
         learning_rate=0.0005,  # Learning rate for Q-network
         buffer_size=100000,    # Replay buffer size for 3D environment
         learning_starts=1000,  # Start learning after 1000 steps
-        batch_size=64,         # Batch size for training
+        batch_size=settings["batch_size"],  # Batch size for training
+        # train_freq counts vectorized steps, so do one update per env to keep 1 update per 4 samples
+        gradient_steps=settings["n_envs"],
         tau=1.0,               # Soft update coefficient for target network
         gamma=0.99,            # Discount factor
         exploration_fraction=0.2,  # Fraction of total steps for epsilon decay
         exploration_initial_eps=1.0,  # Initial exploration epsilon
         exploration_final_eps=0.02,   # Final exploration epsilon
         target_update_interval=1000,  # Update target network every 1000 steps
-        verbose=1,  # Print training info
-        tensorboard_log="./training/tensorboard_logs/dqn/"  # TensorBoard logging
+        verbose=0 if trial else 1,  # Print training info
+        tensorboard_log=None if trial else "./training/tensorboard_logs/dqn/"  # TensorBoard logging
     )
 
+    if trial:
+        model.learn(total_timesteps=total_timesteps, callback=trial_callback)
+        env.close()
+        return model
+
     # Define callbacks
+    # Callback frequencies count vectorized steps, so divide by the number of envs
     checkpoint_callback = CheckpointCallback(
-        save_freq=10000,  # Save every 10,000 steps
+        save_freq=max(10000 // settings["n_envs"], 1),  # Save every 10,000 steps
         save_path="./models/dqn/",
         name_prefix="dqn_language_model",
         save_replay_buffer=True  # Save replay buffer for resuming
@@ -53,7 +63,7 @@ def train_dqn():
         eval_env,
         best_model_save_path="./models/dqn/best_model/",
         log_path="./training/logs/dqn_eval_logs",
-        eval_freq=5000,  # Evaluate every 5000 steps
+        eval_freq=max(5000 // settings["n_envs"], 1),  # Evaluate every 5000 steps
         deterministic=True,
         render=False
     )
@@ -61,7 +71,7 @@ def train_dqn():
     # Train the model
     print("Starting DQN training...")
     model.learn(
-        total_timesteps=100000,  # Train for 100,000 steps
+        total_timesteps=total_timesteps,  # Train for 100,000 steps by default
         callback=[checkpoint_callback, eval_callback],
         log_interval=100  # Log every 100 episodes
     )
@@ -73,6 +83,7 @@ def train_dqn():
 
     env.close()
     eval_env.close()
+    return model
 
 
 if __name__ == "__main__":
@@ -1,45 +1,53 @@
 import os
 import gymnasium as gym
+import torch
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import CheckpointCallback, EvalCallback
 from stable_baselines3.common.monitor import Monitor
-from gymnasium.envs.registration import register
 import sys
 # Append the project root directory to sys.path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
+import environment  # noqa: E402,F401 (registers LanguageLearningEnv-v0)
+from training.tuned_settings import load_tuned_settings, make_training_env  # noqa: E402
 
-# Register the custom environment
-register(
-    id="LanguageLearningEnv-v0",
-    entry_point="environment.custom_env:LanguageLearningEnv",
-)
 
+def train_ppo(settings=None, total_timesteps=100000, trial_callback=None):
+    # Throughput settings: autotuned for this host if available, else the old defaults.
+    # A trial run (autotune passes trial_callback) skips logging, callbacks and saving.
+    trial = trial_callback is not None
+    settings = settings or load_tuned_settings("ppo")
+    if settings["torch_threads"]:
+        torch.set_num_threads(settings["torch_threads"])
 
-def train_ppo():
-    # Create the environment and wrap with Monitor for logging
-    env = gym.make("LanguageLearningEnv-v0")
-    env = Monitor(env, filename="./training/logs/ppo_monitor_logs")
+    # Create the (vectorized) environment, each copy wrapped with Monitor for logging
+    env = make_training_env(
+        settings, monitor_path=None if trial else "./training/logs/ppo_monitor_logs")
 
     # Define the PPO model with tuned hyperparameters
     model = PPO(
         policy="MlpPolicy",  # Multi-layer perceptron policy
         env=env,
         learning_rate=0.0003,  # Learning rate for policy and value networks
-        n_steps=2048,          # Steps per update (rollout buffer size)
-        batch_size=64,         # Mini-batch size for optimization
+        n_steps=max(2048 // settings["n_envs"], 1),  # Steps per env per update (2048 in total)
+        batch_size=settings["batch_size"],  # Mini-batch size for optimization
         n_epochs=10,           # Number of epochs per update
         gamma=0.99,            # Discount factor
         gae_lambda=0.95,       # Generalized Advantage Estimation lambda
         ent_coef=0.01,         # Entropy coefficient for exploration
-        verbose=1,             # Print training info
-        tensorboard_log="./training/tensorboard_logs/ppo/"  # TensorBoard logging
+        verbose=0 if trial else 1,  # Print training info
+        tensorboard_log=None if trial else "./training/tensorboard_logs/ppo/"  # TensorBoard logging
     )
 
+    if trial:
+        model.learn(total_timesteps=total_timesteps, callback=trial_callback)
+        env.close()
+        return model
+
     # Define callbacks
+    # Callback frequencies count vectorized steps, so divide by the number of envs
     checkpoint_callback = CheckpointCallback(
-        save_freq=10000,  # Save every 10,000 steps
+        save_freq=max(10000 // settings["n_envs"], 1),  # Save every 10,000 steps
         save_path="./models/pg/",
         name_prefix="ppo_language_model"
     )
@@ -49,7 +57,7 @@ def train_ppo():
         eval_env,
         best_model_save_path="./models/pg/best_model/",
         log_path="./training/logs/ppo_eval_logs",
-        eval_freq=5000,  # Evaluate every 5000 steps
+        eval_freq=max(5000 // settings["n_envs"], 1),  # Evaluate every 5000 steps
         deterministic=True,
         render=False
     )
@@ -57,7 +65,7 @@ def train_ppo():
     # Train the model
     print("Starting PPO training...")
     model.learn(
-        total_timesteps=100000,  # Train for 100,000 steps
+        total_timesteps=total_timesteps,  # Train for 100,000 steps by default
         callback=[checkpoint_callback, eval_callback],
         log_interval=100  # Log every 100 episodes
     )
@@ -69,6 +77,7 @@ def train_ppo():
 
     env.close()
     eval_env.close()
+    return model
 
 
 if __name__ == "__main__":
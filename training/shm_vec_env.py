@@ -0,0 +1,304 @@
+import multiprocessing as mp
+import time
+import traceback
+import warnings
+from multiprocessing import shared_memory
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper, VecEnv
+
+# Per-worker command codes written to shared memory before releasing a worker
+CMD_STEP = 1
+CMD_PIPE = 2
+CMD_CLOSE = 3
+# How often a waiting main process checks that its workers are still alive (seconds)
+WORKER_POLL_INTERVAL = 1.0
+
+
+def _shared_layout(n_envs, observation_space, action_space):
+    """(name, dtype, shape) of every array in the shared block, in order."""
+    action_dtype = np.int64 if isinstance(
+        action_space, spaces.Discrete) else action_space.dtype
+    return [
+        ("obs", observation_space.dtype, (n_envs,) + observation_space.shape),
+        ("terminal_obs", observation_space.dtype, (n_envs,) + observation_space.shape),
+        ("actions", action_dtype, (n_envs,) + action_space.shape),
+        ("rewards", np.float32, (n_envs,)),
+        ("dones", np.bool_, (n_envs,)),
+        ("truncated", np.bool_, (n_envs,)),
+        ("episode_return", np.float64, (n_envs,)),
+        ("episode_length", np.int64, (n_envs,)),
+        ("commands", np.int8, (n_envs,)),
+        ("errors", np.bool_, (n_envs,)),
+        ("send_info", np.bool_, (1,)),
+    ]
+
+
+def _layout_size(layout):
+    # Align every array to 8 bytes
+    return sum(-(-int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8
+               for _, dtype, shape in layout)
+
+
+def _shared_views(buffer, layout):
+    views, offset = {}, 0
+    for name, dtype, shape in layout:
+        views[name] = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        offset += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8
+    return views
+
+
+def _worker(index, remote, parent_remote, env_fn_wrapper, start, done):
+    from stable_baselines3.common.env_util import is_wrapped
+
+    parent_remote.close()
+    env = env_fn_wrapper.var()
+    remote.send((env.observation_space, env.action_space))
+    shm_name, layout = remote.recv()
+    block = shared_memory.SharedMemory(name=shm_name)
+    shared = _shared_views(block.buf, layout)
+    episode_return, episode_length = 0.0, 0
+
+    while True:
+        start.acquire()
+        command = shared["commands"][index]
+        if command == CMD_CLOSE:
+            env.close()
+            del shared
+            block.close()
+            done.release()
+            break
+        try:
+            if command == CMD_STEP:
+                action = shared["actions"][index]
+                observation, reward, terminated, truncated, info = env.step(
+                    action.item() if action.ndim == 0 else action)
+                episode_return += reward
+                episode_length += 1
+                is_done = terminated or truncated
+                if is_done:
+                    shared["terminal_obs"][index] = observation
+                    shared["truncated"][index] = truncated and not terminated
+                    shared["episode_return"][index] = episode_return
+                    shared["episode_length"][index] = episode_length
+                    episode_return, episode_length = 0.0, 0
+                    observation, _ = env.reset()
+                shared["obs"][index] = observation
+                shared["rewards"][index] = reward
+                shared["dones"][index] = is_done
+                if shared["send_info"][0]:
+                    remote.send(info)
+            elif command == CMD_PIPE:
+                cmd, data = remote.recv()
+                if cmd == "reset":
+                    maybe_options = {"options": data[1]} if data[1] else {}
+                    observation, reset_info = env.reset(seed=data[0], **maybe_options)
+                    shared["obs"][index] = observation
+                    episode_return, episode_length = 0.0, 0
+                    remote.send(reset_info)
+                elif cmd == "render":
+                    remote.send(env.render())
+                elif cmd == "env_method":
+                    method = env.get_wrapper_attr(data[0])
+                    remote.send(method(*data[1], **data[2]))
+                elif cmd == "get_attr":
+                    remote.send(env.get_wrapper_attr(data))
+                elif cmd == "has_attr":
+                    try:
+                        env.get_wrapper_attr(data)
+                        remote.send(True)
+                    except AttributeError:
+                        remote.send(False)
+                elif cmd == "set_attr":
+                    remote.send(setattr(env, data[0], data[1]))
+                elif cmd == "is_wrapped":
+                    remote.send(is_wrapped(env, data))
+                else:
+                    raise NotImplementedError(
+                        f"`{cmd}` is not implemented in the worker")
+        except Exception:
+            # Report the error instead of dying, so the main process raises rather than waiting forever
+            shared["errors"][index] = True
+            remote.send(RuntimeError(
+                f"SharedMemoryVecEnv worker {index} failed:\n{traceback.format_exc()}"))
+        done.release()
+
+
+class SharedMemoryVecEnv(VecEnv):
+    """Multiprocess VecEnv that exchanges step data through one shared-memory block.
+
+    Drop-in replacement for SubprocVecEnv for Box-observation envs. On every
+    step the main process writes actions into shared NumPy arrays and releases
+    a semaphore per worker; workers write observations, rewards and done flags
+    back in place, so nothing is pickled. Infos are rebuilt in the main
+    process from shared arrays (TimeLimit.truncated, terminal_observation and
+    Monitor-style "episode" stats); set send_info=True to also receive each
+    env's full info dict through its pipe. Rare calls (reset, get_attr,
+    env_method, render) go through the pipe as in SubprocVecEnv. An exception
+    in a worker is re-raised in the main process as a RuntimeError with the
+    worker's traceback; a worker that dies raises EOFError instead of
+    blocking the caller.
+    """
+
+    def __init__(self, env_fns, start_method=None, send_info=False):
+        self.waiting = False
+        self.closed = False
+        n_envs = len(env_fns)
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_envs)])
+        self.start_sems = [ctx.Semaphore(0) for _ in range(n_envs)]
+        self.done_sems = [ctx.Semaphore(0) for _ in range(n_envs)]
+        self.processes = []
+        for index, (work_remote, remote, env_fn) in enumerate(zip(self.work_remotes, self.remotes, env_fns)):
+            args = (index, work_remote, remote, CloudpickleWrapper(env_fn),
+                    self.start_sems[index], self.done_sems[index])
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        observation_space, action_space = self.remotes[0].recv()
+        for remote in self.remotes[1:]:
+            remote.recv()
+        if not isinstance(observation_space, spaces.Box):
+            raise ValueError(
+                "SharedMemoryVecEnv only supports Box observation spaces")
+
+        layout = _shared_layout(n_envs, observation_space, action_space)
+        self.block = shared_memory.SharedMemory(
+            create=True, size=_layout_size(layout))
+        self.shared = _shared_views(self.block.buf, layout)
+        self.shared["send_info"][0] = send_info
+        for remote in self.remotes:
+            remote.send((self.block.name, layout))
+        self.t_start = time.time()
+
+        super().__init__(n_envs, observation_space, action_space)
+
+    @property
+    def send_info(self):
+        return bool(self.shared["send_info"][0])
+
+    @send_info.setter
+    def send_info(self, value):
+        self.shared["send_info"][0] = value
+
+    def step_async(self, actions):
+        self.shared["actions"][:] = np.asarray(actions).reshape(self.shared["actions"].shape)
+        self.shared["commands"][:] = CMD_STEP
+        for sem in self.start_sems:
+            sem.release()
+        self.waiting = True
+
+    def step_wait(self):
+        try:
+            # Infos are read before waiting so a large info can never block a worker's send
+            full_infos = [remote.recv() for remote in self.remotes] if self.send_info else None
+            self._wait_for_workers(range(self.num_envs))
+        finally:
+            self.waiting = False
+        shared = self.shared
+        if shared["errors"].any():
+            self._raise_worker_error(dict(enumerate(full_infos)) if full_infos else {})
+
+        infos = []
+        for index in range(self.num_envs):
+            info = full_infos[index] if full_infos else {}
+            if shared["dones"][index]:
+                info["TimeLimit.truncated"] = bool(shared["truncated"][index])
+                info["terminal_observation"] = shared["terminal_obs"][index].copy()
+                info["episode"] = {
+                    "r": float(shared["episode_return"][index]),
+                    "l": int(shared["episode_length"][index]),
+                    "t": round(time.time() - self.t_start, 6)
+                }
+            else:
+                info["TimeLimit.truncated"] = False
+            infos.append(info)
+        return shared["obs"].copy(), shared["rewards"].copy(), shared["dones"].copy(), infos
+
+    def reset(self):
+        self.reset_infos = self._call_workers(
+            "reset", [(self._seeds[i], self._options[i]) for i in range(self.num_envs)])
+        self._reset_seeds()
+        self._reset_options()
+        return self.shared["obs"].copy()
+
+    def close(self):
+        if self.closed:
+            return
+        if self.waiting:
+            try:
+                self._wait_for_workers(range(self.num_envs))
+            except EOFError:
+                pass
+        self.shared["commands"][:] = CMD_CLOSE
+        for sem in self.start_sems:
+            sem.release()
+        for process in self.processes:
+            process.join()
+        del self.shared
+        self.block.close()
+        self.block.unlink()
+        self.closed = True
+
+    def _call_workers(self, cmd, data_per_env, indices=None):
+        indices = list(self._get_indices(indices))
+        for index, data in zip(indices, data_per_env):
+            self.shared["commands"][index] = CMD_PIPE
+            self.remotes[index].send((cmd, data))
+            self.start_sems[index].release()
+        results = [self.remotes[index].recv() for index in indices]
+        self._wait_for_workers(indices)
+        if self.shared["errors"].any():
+            self._raise_worker_error(dict(zip(indices, results)))
+        return results
+
+    def _wait_for_workers(self, indices):
+        """Wait until each worker in `indices` has finished its command; raise EOFError if one has died."""
+        for index in indices:
+            while not self.done_sems[index].acquire(timeout=WORKER_POLL_INTERVAL):
+                if not self.processes[index].is_alive():
+                    raise EOFError(
+                        f"SharedMemoryVecEnv worker {index} died "
+                        f"(exit code {self.processes[index].exitcode})")
+
+    def _raise_worker_error(self, received):
+        """Raise the first error reported by a worker; `received` maps index -> object already read from its pipe."""
+        failed = np.flatnonzero(self.shared["errors"])
+        errors = [received[int(index)] if int(index) in received else self.remotes[index].recv()
+                  for index in failed]
+        self.shared["errors"][:] = False
+        raise errors[0]
+
+    def get_images(self):
+        if self.render_mode != "rgb_array":
+            warnings.warn(
+                f"The render mode is {self.render_mode}, but this method assumes it is `rgb_array` to obtain images.")
+            return [None for _ in self.remotes]
+        return self._call_workers("render", [None] * self.num_envs)
+
+    def has_attr(self, attr_name):
+        return all(self._call_workers("has_attr", [attr_name] * self.num_envs))
+
+    def get_attr(self, attr_name, indices=None):
+        n = len(list(self._get_indices(indices)))
+        return self._call_workers("get_attr", [attr_name] * n, indices)
+
+    def set_attr(self, attr_name, value, indices=None):
+        n = len(list(self._get_indices(indices)))
+        self._call_workers("set_attr", [(attr_name, value)] * n, indices)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        n = len(list(self._get_indices(indices)))
+        return self._call_workers(
+            "env_method", [(method_name, method_args, method_kwargs)] * n, indices)
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        n = len(list(self._get_indices(indices)))
+        return self._call_workers("is_wrapped", [wrapper_class] * n, indices)
@@ -0,0 +1,76 @@
+import json
+import os
+import platform
+import sys
+from functools import partial
+import torch
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+
+# Append the project root directory to sys.path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from environment.custom_env import LanguageLearningEnv  # noqa: E402
+from training.shm_vec_env import SharedMemoryVecEnv  # noqa: E402
+
+TUNED_SETTINGS_PATH = "./training/autotune.json"
+
+# Settings the training scripts used before autotuning; torch_threads=None keeps torch's default
+DEFAULT_SETTINGS = {
+    "dqn": {"n_envs": 1, "vec_env": "dummy", "torch_threads": None, "batch_size": 64},
+    "ppo": {"n_envs": 1, "vec_env": "dummy", "torch_threads": None, "batch_size": 64},
+}
+VEC_ENV_BACKENDS = {
+    "dummy": DummyVecEnv,
+    "subproc": SubprocVecEnv,
+    "shm": SharedMemoryVecEnv,
+}
+
+
+def host_key():
+    """Identify the hardware a tuned config belongs to: hostname, CPU count and GPU."""
+    gpu = torch.cuda.get_device_name(0) if torch.cuda.is_available() else "cpu"
+    return f"{platform.node()}|{os.cpu_count()}cpu|{gpu}"
+
+
+def load_tuned_settings(algo, path=TUNED_SETTINGS_PATH):
+    """Best settings saved by autotune for this host, falling back to DEFAULT_SETTINGS."""
+    settings = dict(DEFAULT_SETTINGS[algo])
+    if os.path.exists(path):
+        with open(path) as f:
+            tuned = json.load(f).get(host_key(), {}).get(algo)
+        if tuned:
+            settings.update(tuned["settings"])
+            print(f"Using autotuned {algo.upper()} settings: {settings}")
+    return settings
+
+
+def save_tuned_settings(algo, settings, metrics, path=TUNED_SETTINGS_PATH):
+    """Store the winning settings and their measured throughput under this host's key."""
+    tuned = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            tuned = json.load(f)
+    tuned.setdefault(host_key(), {})[algo] = {
+        "settings": settings, "metrics": metrics}
+    with open(path, "w") as f:
+        json.dump(tuned, f, indent=2, sort_keys=True)
+
+
+def _make_env(monitor_path):
+    return Monitor(LanguageLearningEnv(), filename=monitor_path)
+
+
+def make_training_env(settings, monitor_path=None):
+    """Vectorized training env with settings["n_envs"] copies on the chosen backend.
+
+    With several envs each one logs to its own <monitor_path>_<rank>.monitor.csv.
+    """
+    n_envs = settings["n_envs"]
+    env_fns = []
+    for rank in range(n_envs):
+        path = monitor_path
+        if monitor_path and n_envs > 1:
+            path = f"{monitor_path}_{rank}"
+        env_fns.append(partial(_make_env, path))
+    return VEC_ENV_BACKENDS[settings["vec_env"]](env_fns)